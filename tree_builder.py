@@ -0,0 +1,137 @@
+"""
+Tree rendering helpers for the XDF schematic.
+
+The recursive tree walker and the node summary function live here, free of
+class state and fully type-annotated, so this module can optionally be
+compiled with mypyc for a faster tree render:
+
+    pip install mypy
+    mypyc tree_builder.py
+
+xdf_extraction.py imports it the same way whether it is compiled or not.
+
+Author: theScientist@theBasicScientist.com
+License: GNU GENERAL PUBLIC LICENSE V3
+"""
+
+import sys
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+import numpy as np
+
+# Arrays larger than this are summarized from a strided subsample
+STATS_SAMPLE_THRESHOLD: int = 1_000_000
+STATS_SAMPLE_COUNT: int = 10_000
+
+# Stream keys shown first in the tree, in this order
+PRIORITY_KEYS: Tuple[str, ...] = ('info', 'time_series', 'time_stamps', 'footer')
+_PRIORITY_SET: FrozenSet[str] = frozenset(PRIORITY_KEYS)
+
+
+def get_type_and_info(obj: Any, info_cache: Dict[int, Tuple[str, str]]) -> Tuple[str, str]:
+    """
+    Get type and summary info for an object.
+
+    Parameters
+    ----------
+    obj : any
+        Node of the stream structure
+    info_cache : dict
+        (type, info) pairs of ndarrays keyed by id(), filled on first use
+    """
+    if isinstance(obj, np.ndarray):
+        # Arrays are scanned for min/max, so only do it once per array
+        cached = info_cache.get(id(obj))
+        if cached is not None:
+            return cached
+        dtype = f"ndarray[{obj.dtype}]"
+        info = f"shape {obj.shape}"
+        # NumPy has no fused min/max reduction (np.ptp calls both), so the two
+        # passes are kept; the result is cached and huge arrays are subsampled
+        if obj.size > STATS_SAMPLE_THRESHOLD:
+            # Subsample whole rows (axis 0) so every channel is represented;
+            # basic slicing is a view, so nothing is copied even if non-contiguous
+            row_size = obj.size // obj.shape[0]
+            n_rows = max(1, STATS_SAMPLE_COUNT // row_size)
+            sample = obj[::max(1, obj.shape[0] // n_rows)]
+            info += f", approx. range [{sample.min():.2f}, {sample.max():.2f}]"
+        elif obj.size > 0:
+            info += f", range [{obj.min():.2f}, {obj.max():.2f}]"
+        info_cache[id(obj)] = (dtype, info)
+        return dtype, info
+    elif isinstance(obj, list):
+        return "list", f"{len(obj)} items"
+    elif isinstance(obj, dict):
+        return "dict", f"{len(obj)} keys"
+    elif isinstance(obj, str):
+        return "str", f'"{obj[:50]}..."' if len(obj) > 50 else f'"{obj}"'
+    elif isinstance(obj, (int, float)):
+        return type(obj).__name__, str(obj)
+    else:
+        return type(obj).__name__, str(obj)[:50]
+
+
+def build_tree_nodes(obj: Any, name: str, nodes: List[Dict[str, Any]],
+                     size_cache: Dict[int, int],
+                     info_cache: Dict[int, Tuple[str, str]],
+                     level: int = 0, max_depth: int = 6) -> int:
+    """
+    Flatten the tree under obj into a compact node list for the browser.
+
+    Each node is a dict with keys 'n' (name), 't' (type), 'i' (info),
+    's' (size in MB, 0 if too small to show) and 'c' (indices of child nodes).
+    The page renders nodes from this list on demand when they are expanded.
+
+    Parameters
+    ----------
+    obj : any
+        Node to flatten
+    name : str
+        Label of the node
+    nodes : list of dict
+        Accumulator the nodes are appended to
+    size_cache : dict
+        Byte sizes of containers and arrays keyed by id()
+    info_cache : dict
+        Cache passed to get_type_and_info()
+    level : int
+        Depth of this node
+    max_depth : int
+        Maximum depth to traverse
+
+    Returns
+    -------
+    int
+        Index of obj's node in nodes
+    """
+    obj_type, obj_info = get_type_and_info(obj, info_cache)
+    size_mb = size_cache.get(id(obj), sys.getsizeof(obj)) / (1024 * 1024)
+
+    node_idx = len(nodes)
+    children: List[int] = []
+    nodes.append({
+        'n': name,
+        't': obj_type,
+        'i': obj_info,
+        's': round(size_mb, 2) if size_mb > 0.01 else 0,
+        'c': children,
+    })
+
+    if level >= max_depth:
+        return node_idx
+
+    if isinstance(obj, dict):
+        # Prioritize certain keys
+        keys = obj.keys()
+        sorted_keys = [k for k in PRIORITY_KEYS if k in keys] + [k for k in keys if k not in _PRIORITY_SET]
+
+        for key in sorted_keys:
+            children.append(build_tree_nodes(
+                obj[key], str(key), nodes, size_cache, info_cache, level + 1, max_depth
+            ))
+    elif isinstance(obj, list) and len(obj) > 0 and isinstance(obj[0], dict):
+        children.append(build_tree_nodes(
+            obj[0], "[0]", nodes, size_cache, info_cache, level + 1, max_depth
+        ))
+
+    return node_idx
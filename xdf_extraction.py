@@ -20,10 +20,45 @@ For more information, see README.md
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Tuple, Optional
+import os
 import sys
+import gzip
+import struct
+import json
 import argparse
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import defaultdict, namedtuple
 from pathlib import Path
 
+# Tree walker lives in its own module so it can be compiled with mypyc
+from tree_builder import build_tree_nodes, get_type_and_info
+
+# Behavioral tables longer than this only show head/tail previews in the HTML
+MAX_HTML_ROWS = 2000
+
+# Translation table used to HTML-escape marker strings and stream names
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Columns of the stream summary table and their dtypes
+SUMMARY_DTYPES = {
+    'index': 'int32',
+    'name': 'object',
+    'type': 'object',
+    'channels': 'int32',
+    'srate_hz': 'float64',
+    'samples': 'int64',
+    'duration_sec': 'float64',
+    'size_mb': 'float32',
+    'time_series_shape': 'object',
+}
+
+# Per-stream metadata snapshot, read once from the pyxdf stream dicts
+StreamMeta = namedtuple('StreamMeta', [
+    'index', 'name', 'stream_type', 'channels', 'srate', 'samples', 'duration',
+    'time_series', 'time_stamps',
+])
+
 class XDFSchematicGenerator:
     """
     Generates hierarchical tree visualizations of XDF dictionary structure.
@@ -51,18 +86,62 @@ class XDFSchematicGenerator:
         self.stream_summary = None
         self.behavioral_idx = None
         self.behavioral_stream_name = behavioral_stream_name
+        self._size_cache = None
+        self._info_cache: Dict[int, Tuple[str, str]] = {}
+        
+        # Snapshot stream metadata once instead of re-reading the info dicts
+        self._meta = [self._snapshot_stream(idx, stream) for idx, stream in enumerate(streams)]
         
         # Find behavioral stream index
         self._find_behavioral_stream()
         
+    @staticmethod
+    def _xml_get(info: Dict[str, Any], key: str, default: Any = '') -> Any:
+        """Get a value from pyxdf's XML-like info dict, unwrapping single-item lists."""
+        value = info.get(key, default)
+        if isinstance(value, list):
+            return value[0] if value else default
+        return value
+    
+    def _snapshot_stream(self, stream_idx: int, stream: Dict) -> StreamMeta:
+        """Read the metadata of one stream into a StreamMeta record."""
+        info = stream.get('info', {})
+        time_series = stream.get('time_series', np.array([]))
+        time_stamps = stream.get('time_stamps', np.array([]))
+        
+        duration = 0
+        if len(time_stamps) > 1:
+            duration = time_stamps[-1] - time_stamps[0]
+        elif 'samples_count' in stream:
+            # Headers-only streams carry no time stamps, use the footer instead.
+            # Without a usable footer (e.g. interrupted recording) it is unknown.
+            footer = stream.get('footer', {}).get('info', {})
+            try:
+                first = float(self._xml_get(footer, 'first_timestamp', None))
+                last = float(self._xml_get(footer, 'last_timestamp', None))
+                duration = last - first
+            except (TypeError, ValueError):
+                duration = float('nan')
+        
+        return StreamMeta(
+            index=stream_idx,
+            name=self._xml_get(info, 'name'),
+            stream_type=self._xml_get(info, 'type', 'Unknown'),
+            channels=int(self._xml_get(info, 'channel_count', 0)),
+            srate=float(self._xml_get(info, 'nominal_srate', 0)),
+            samples=stream.get('samples_count', len(time_stamps)),
+            duration=duration,
+            time_series=time_series,
+            time_stamps=time_stamps,
+        )
+    
     def _find_behavioral_stream(self):
         """Find the index of the behavioral stream."""
         # Common behavioral stream names to search for
         default_names = ['stimlabels', 'markers', 'events', 'triggers', 'behavioral']
         
-        for idx, stream in enumerate(self.streams):
-            info = stream.get('info', {})
-            name = info.get('name', [''])[0] if isinstance(info.get('name'), list) else info.get('name', '')
+        for idx, meta in enumerate(self._meta):
+            name = meta.name
             name_lower = name.lower()
             
             # If specific name provided, match it exactly (case-insensitive)
@@ -82,103 +161,92 @@ class XDFSchematicGenerator:
         
         if self.behavioral_idx is None:
             print("Warning: No behavioral stream found. Available streams:")
-            for idx, stream in enumerate(self.streams):
-                info = stream.get('info', {})
-                name = info.get('name', [''])[0] if isinstance(info.get('name'), list) else info.get('name', '')
-                print(f"  [{idx}] {name}")
+            for meta in self._meta:
+                print(f"  [{meta.index}] {meta.name}")
+    
+    def _compute_sizes(self) -> None:
+        """
+        Precompute the memory footprint (bytes) of every dict, list and
+        ndarray reachable from the streams in a single post-order pass.
+        
+        Sizes are keyed by id() so nested containers are only walked once,
+        and already-visited objects are skipped to break reference cycles.
+        """
+        cache = {}
+        visited = set()
+        stack = [(self.streams, False)]
+        
+        while stack:
+            obj, children_done = stack.pop()
+            
+            if children_done:
+                # All children are sized, sum them into the container
+                total_size = sys.getsizeof(obj)
+                if isinstance(obj, dict):
+                    for key, value in obj.items():
+                        total_size += sys.getsizeof(key)
+                        total_size += cache.get(id(value), sys.getsizeof(value))
+                else:
+                    for item in obj:
+                        total_size += cache.get(id(item), sys.getsizeof(item))
+                cache[id(obj)] = total_size
+                continue
+            
+            if id(obj) in visited:
+                continue
+            visited.add(id(obj))
+            
+            if isinstance(obj, np.ndarray):
+                # For numpy arrays, use nbytes for accurate size
+                cache[id(obj)] = obj.nbytes
+                continue
+            
+            stack.append((obj, True))
+            children = obj.values() if isinstance(obj, dict) else obj
+            for child in children:
+                if isinstance(child, (dict, list, np.ndarray)) and id(child) not in visited:
+                    stack.append((child, False))
+        
+        self._size_cache = cache
     
     def _get_size_mb(self, obj: Any) -> float:
         """Estimate memory footprint in MB."""
-        total_size = sys.getsizeof(obj)
-
-        # For dictionaries, recursively calculate size of contents
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                total_size += sys.getsizeof(key)
-                if isinstance(value, np.ndarray):
-                    # For numpy arrays, use nbytes for accurate size
-                    total_size += value.nbytes
-                elif isinstance(value, (list, dict)):
-                    # Recursively calculate for nested structures
-                    total_size += self._get_size_mb(value) * 1024 * 1024  # Convert back to bytes
-                else:
-                    total_size += sys.getsizeof(value)
-        elif isinstance(obj, np.ndarray):
-            total_size = obj.nbytes
-        elif isinstance(obj, list):
-            for item in obj:
-                if isinstance(item, np.ndarray):
-                    total_size += item.nbytes
-                else:
-                    total_size += sys.getsizeof(item)
-
-        return total_size / (1024 * 1024)
+        if self._size_cache is None:
+            self._compute_sizes()
+        return self._size_cache.get(id(obj), sys.getsizeof(obj)) / (1024 * 1024)
     
     def _get_type_and_info(self, obj: Any) -> Tuple[str, str]:
         """Get type and summary info for an object."""
-        if isinstance(obj, np.ndarray):
-            dtype = f"ndarray[{obj.dtype}]"
-            info = f"shape {obj.shape}"
-            if obj.size > 0:
-                info += f", range [{np.min(obj):.2f}, {np.max(obj):.2f}]"
-            return dtype, info
-        elif isinstance(obj, list):
-            return "list", f"{len(obj)} items"
-        elif isinstance(obj, dict):
-            return "dict", f"{len(obj)} keys"
-        elif isinstance(obj, str):
-            return "str", f'"{obj[:50]}..."' if len(obj) > 50 else f'"{obj}"'
-        elif isinstance(obj, (int, float)):
-            return type(obj).__name__, str(obj)
-        else:
-            return type(obj).__name__, str(obj)[:50]
+        return get_type_and_info(obj, self._info_cache)
     
-    def _extract_stream_info(self, stream_idx: int, stream: Dict) -> Dict:
-        """Extract key metadata from a stream."""
-        info = stream.get('info', {})
-        time_series = stream.get('time_series', np.array([]))
-        time_stamps = stream.get('time_stamps', np.array([]))
-        
-        # Handle nested XML-like info structure
-        def get_nested(d, key, default='N/A'):
-            val = d.get(key, [default])
-            return val[0] if isinstance(val, list) and len(val) > 0 else val
-        
-        stream_name = get_nested(info, 'name', f'Stream_{stream_idx}')
-        stream_type = get_nested(info, 'type', 'Unknown')
-        channel_count = int(get_nested(info, 'channel_count', 0))
-        srate = float(get_nested(info, 'nominal_srate', 0))
-        
-        duration = 0
-        if len(time_stamps) > 1:
-            duration = time_stamps[-1] - time_stamps[0]
-        
-        return {
-            'index': stream_idx,
-            'name': stream_name,
-            'type': stream_type,
-            'channels': channel_count,
-            'srate_hz': srate,
-            'samples': len(time_stamps),
-            'duration_sec': duration,
-            'size_mb': self._get_size_mb(stream),
-            'time_series_shape': time_series.shape if hasattr(time_series, 'shape') else 'N/A'
-        }
+    def _extract_stream_info(self, stream_idx: int, stream: Dict) -> Tuple:
+        """Extract key metadata from a stream as a row in SUMMARY_DTYPES order."""
+        meta = self._meta[stream_idx]
+        return (
+            stream_idx,
+            meta.name or f'Stream_{stream_idx}',
+            meta.stream_type,
+            meta.channels,
+            meta.srate,
+            meta.samples,
+            meta.duration,
+            self._get_size_mb(stream),
+            # Headers-only streams have no decoded samples to take a shape from
+            meta.time_series.shape
+            if hasattr(meta.time_series, 'shape') and 'samples_count' not in stream else 'N/A',
+        )
     
     def generate_summary_table(self) -> pd.DataFrame:
         """Generate summary table of all streams."""
-        summaries = []
-        
-        # Add behavioral stream first if found
+        # Behavioral stream first if found, then the remaining streams
+        order = [idx for idx in range(len(self.streams)) if idx != self.behavioral_idx]
         if self.behavioral_idx is not None:
-            summaries.append(self._extract_stream_info(self.behavioral_idx, self.streams[self.behavioral_idx]))
+            order.insert(0, self.behavioral_idx)
+        rows = [self._extract_stream_info(idx, self.streams[idx]) for idx in order]
         
-        # Add remaining streams
-        for idx, stream in enumerate(self.streams):
-            if idx != self.behavioral_idx:
-                summaries.append(self._extract_stream_info(idx, stream))
-        
-        self.stream_summary = pd.DataFrame(summaries)
+        self.stream_summary = pd.DataFrame.from_records(
+            rows, columns=list(SUMMARY_DTYPES)
+        ).astype(SUMMARY_DTYPES)
         return self.stream_summary
     
     def get_behavioral_data(self) -> pd.DataFrame:
@@ -193,11 +261,14 @@ class XDFSchematicGenerator:
         if self.behavioral_idx is None:
             return pd.DataFrame()
         
-        stream = self.streams[self.behavioral_idx]
-        time_series = stream.get('time_series', [])
-        time_stamps = stream.get('time_stamps', [])
+        meta = self._meta[self.behavioral_idx]
+        time_series = meta.time_series
+        time_stamps = meta.time_stamps
         
-        df = pd.DataFrame()
+        # Collect columns first and build the DataFrame once so numeric
+        # columns stay zero-copy views of the pyxdf buffers
+        columns = {}
+        infer_dtypes = False
         
         # Handle different time_series formats
         if isinstance(time_series, np.ndarray):
@@ -206,13 +277,13 @@ class XDFSchematicGenerator:
                 n_cols = time_series.shape[1]
                 # Create column names based on number of features
                 if n_cols == 1:
-                    df["time_series"] = time_series[:, 0]
+                    columns["time_series"] = time_series[:, 0]
                 else:
                     for i in range(n_cols):
-                        df[f"feature_{i}"] = time_series[:, i]
+                        columns[f"feature_{i}"] = time_series[:, i]
             else:
                 # 1D array - single feature
-                df["time_series"] = time_series
+                columns["time_series"] = time_series
                 
         elif isinstance(time_series, list) and len(time_series) > 0:
             # List of values
@@ -220,19 +291,48 @@ class XDFSchematicGenerator:
                 # List of arrays/lists - each is a row with multiple features
                 n_cols = len(time_series[0]) if len(time_series[0]) > 0 else 1
                 
+                if set(map(len, time_series)) == {n_cols}:
+                    # Rectangular rows (typical for markers) - convert in one shot
+                    values = np.asarray(time_series, dtype=object)
+                else:
+                    # Ragged rows - pad missing features with empty strings
+                    values = np.full((len(time_series), n_cols), '', dtype=object)
+                    for row_idx, row in enumerate(time_series):
+                        row = row[:n_cols]
+                        values[row_idx, :len(row)] = row
+                
                 if n_cols == 1:
-                    df["time_series"] = [x[0] if len(x) > 0 else '' for x in time_series]
+                    columns["time_series"] = values[:, 0]
                 else:
                     # Multiple features per sample
                     for i in range(n_cols):
-                        df[f"feature_{i}"] = [x[i] if len(x) > i else '' for x in time_series]
+                        columns[f"feature_{i}"] = values[:, i]
+                
+                # Restore numeric dtypes lost in the object array
+                infer_dtypes = True
             else:
-                # Simple list of scalars or strings
-                df["time_series"] = time_series
+                # Simple list of scalars or strings - convert in one C-level pass
+                # instead of letting pandas infer the type element by element
+                values = time_series
+                item_types = set(map(type, time_series))
+                if item_types <= {int, float}:
+                    # Plain ints/floats only: a bool among them would be coerced
+                    # to a number here, while pandas keeps an object column
+                    values = np.asarray(time_series)
+                    if values.dtype.kind != ('i' if item_types == {int} else 'f'):
+                        # Ints outside the int64 range, let pandas infer
+                        values = time_series
+                elif isinstance(time_series[0], str):
+                    values = np.asarray(time_series, dtype=object)
+                columns["time_series"] = values
         
         # Add timestamps
         if len(time_stamps) > 0:
-            df["time_stamp"] = time_stamps
+            columns["time_stamp"] = time_stamps
+        
+        df = pd.DataFrame(columns, copy=False)
+        if infer_dtypes:
+            df = df.infer_objects()
         
         return df
     
@@ -261,66 +361,51 @@ class XDFSchematicGenerator:
         print(f"Behavioral data saved to: {csv_file}")
         return csv_file
     
-    def _build_interactive_tree_html(self, obj: Any, name: str, level: int = 0, 
-                                    max_depth: int = 6, node_id: str = "root") -> str:
-        """Build interactive collapsible HTML tree."""
-        if level > max_depth:
-            return ""
-        
-        obj_type, obj_info = self._get_type_and_info(obj)
-        size_mb = self._get_size_mb(obj)
-        
-        # Create size display
-        size_str = f" | {size_mb:.2f} MB" if size_mb > 0.01 else ""
-        
-        # Create the node label
-        label = f"{name}: <span class='type'>{obj_type}</span>"
-        if obj_info:
-            label += f" | <span class='info'>{obj_info}</span>"
-        label += size_str
-        
-        html = ""
-        
-        # Check if this node has children
-        has_children = False
-        if isinstance(obj, dict) and level < max_depth:
-            has_children = len(obj) > 0
-        elif isinstance(obj, list) and level < max_depth:
-            has_children = len(obj) > 0 and isinstance(obj[0], dict)
-        
-        if has_children:
-            # Create collapsible node
-            child_id = f"{node_id}_{name}".replace(' ', '_').replace('[', '').replace(']', '')
-            html += f'<div class="tree-node level-{level}">'
-            html += f'<span class="toggle" onclick="toggleNode(\'{child_id}\')">▶</span>'
-            html += f'<span class="label">{label}</span>'
-            html += f'<div id="{child_id}" class="children" style="display:none;">'
-            
-            # Add children
-            if isinstance(obj, dict):
-                # Prioritize certain keys
-                priority_keys = ['info', 'time_series', 'time_stamps', 'footer']
-                other_keys = [k for k in obj.keys() if k not in priority_keys]
-                sorted_keys = [k for k in priority_keys if k in obj.keys()] + other_keys
-                
-                for key in sorted_keys:
-                    html += self._build_interactive_tree_html(
-                        obj[key], str(key), level + 1, max_depth, child_id
-                    )
-            elif isinstance(obj, list) and len(obj) > 0 and isinstance(obj[0], dict):
-                html += self._build_interactive_tree_html(
-                    obj[0], "[0]", level + 1, max_depth, child_id
-                )
-            
-            html += '</div></div>'
-        else:
-            # Leaf node
-            html += f'<div class="tree-node level-{level}">'
-            html += f'<span class="leaf">└</span>'
-            html += f'<span class="label">{label}</span>'
-            html += '</div>'
-        
-        return html
+    def _build_tree_nodes(self, obj: Any, name: str, nodes: List[Dict[str, Any]],
+                          level: int = 0, max_depth: int = 6) -> int:
+        """Flatten the tree under obj into nodes for lazy rendering in the browser."""
+        if self._size_cache is None:
+            self._compute_sizes()
+        return build_tree_nodes(obj, name, nodes, self._size_cache, self._info_cache,
+                                level, max_depth)
+    
+    def _render_stream_trees(self, max_depth: int) -> List[List[Dict[str, Any]]]:
+        """Flatten the tree of every stream into its own node list."""
+        stream_trees = []
+        for idx, stream in enumerate(self.streams):
+            nodes = []
+            self._build_tree_nodes(stream, f"stream[{idx}]", nodes, 0, max_depth)
+            stream_trees.append(nodes)
+        return stream_trees
+    
+    def _build_behavioral_table_html(self, df: pd.DataFrame) -> str:
+        """
+        Build the behavioral data HTML table with vectorized string operations.
+        
+        Each column is formatted in one NumPy call and the row markup is
+        concatenated column by column, avoiding per-cell Python formatting.
+        """
+        header = ''.join(f'<th>{col}</th>' for col in df.columns)
+        
+        rows = np.char.add('<tr><th>', df.index.to_numpy().astype(str))
+        rows = np.char.add(rows, '</th>')
+        for col in df.columns:
+            values = df[col].to_numpy()
+            if values.dtype.kind == 'f':
+                cells = np.char.mod('%.6f', values)
+            elif values.dtype.kind in 'OSU':
+                # Marker strings may contain markup characters
+                cells = df[col].astype(str).str.translate(_HTML_ESCAPE).to_numpy().astype(str)
+            else:
+                cells = values.astype(str)
+            rows = np.char.add(np.char.add(np.char.add(rows, '<td>'), cells), '</td>')
+        rows = np.char.add(rows, '</tr>')
+        
+        return (
+            '<table border="1" class="dataframe">\n'
+            f'<thead><tr><th>sample_index</th>{header}</tr></thead>\n'
+            '<tbody>\n' + '\n'.join(rows.tolist()) + '\n</tbody>\n</table>'
+        )
     
     def generate_interactive_html(self, max_depth: int = 6, 
                                   output_file: str = 'xdf_interactive.html',
@@ -342,6 +427,14 @@ class XDFSchematicGenerator:
         str
             Path to output file
         """
+        # Drop results from earlier calls: the cache is keyed by id(),
+        # which can be reused once the streams have been modified
+        self._info_cache.clear()
+        self._meta = [self._snapshot_stream(idx, stream) for idx, stream in enumerate(self.streams)]
+        
+        # Precompute sizes once for the summary table and tree
+        self._compute_sizes()
+        
         # Generate summary table
         summary_df = self.generate_summary_table()
         
@@ -355,7 +448,8 @@ class XDFSchematicGenerator:
             csv_file = self.save_behavioral_data_csv(output_stem)
         
         # Build HTML
-        html = """
+        parts: List[str] = []
+        parts.append("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -479,9 +573,57 @@ class XDFSchematicGenerator:
         }
     </style>
     <script>
-        function toggleNode(id) {
-            var element = document.getElementById(id);
-            var toggle = event.target;
+        // Tree nodes are rendered from the embedded JSON only when expanded
+        var xdfTrees = null;
+        
+        function renderNode(tree, id, level) {
+            var node = xdfTrees[tree][id];
+            var template = document.getElementById('tree-node-template');
+            var element = template.content.firstElementChild.cloneNode(true);
+            var toggle = element.querySelector('.toggle');
+            var children = element.querySelector('.children');
+            
+            element.className += ' level-' + level;
+            element.querySelector('.name').textContent = node.n;
+            element.querySelector('.type').textContent = node.t;
+            if (node.i) {
+                element.querySelector('.info').textContent = node.i;
+            } else {
+                element.querySelector('.info-part').remove();
+            }
+            if (node.s > 0) {
+                element.querySelector('.size').textContent = ' | ' + node.s.toFixed(2) + ' MB';
+            }
+            
+            if (node.c.length > 0) {
+                toggle.onclick = function () { toggleNode(toggle); };
+                children.dataset.tree = tree;
+                children.dataset.node = id;
+                children.dataset.level = level;
+                children.dataset.pending = 'true';
+            } else {
+                toggle.className = 'leaf';
+                toggle.textContent = '└';
+                children.remove();
+            }
+            return element;
+        }
+        
+        function renderChildren(element) {
+            var tree = element.dataset.tree;
+            var level = Number(element.dataset.level) + 1;
+            var childIds = xdfTrees[tree][element.dataset.node].c;
+            for (var i = 0; i < childIds.length; i++) {
+                element.appendChild(renderNode(tree, childIds[i], level));
+            }
+            delete element.dataset.pending;
+        }
+        
+        function toggleNode(toggle) {
+            var element = toggle.parentNode.lastElementChild;
+            if (element.dataset.pending) {
+                renderChildren(element);
+            }
             if (element.style.display === 'none') {
                 element.style.display = 'block';
                 toggle.textContent = '▼';
@@ -492,6 +634,13 @@ class XDFSchematicGenerator:
         }
         
         function expandAll() {
+            var pending = document.querySelectorAll('.children[data-pending]');
+            while (pending.length > 0) {
+                for (var i = 0; i < pending.length; i++) {
+                    renderChildren(pending[i]);
+                }
+                pending = document.querySelectorAll('.children[data-pending]');
+            }
             var children = document.getElementsByClassName('children');
             var toggles = document.getElementsByClassName('toggle');
             for (var i = 0; i < children.length; i++) {
@@ -512,6 +661,14 @@ class XDFSchematicGenerator:
                 toggles[i].textContent = '▶';
             }
         }
+        
+        document.addEventListener('DOMContentLoaded', function () {
+            xdfTrees = JSON.parse(document.getElementById('xdf-tree').textContent);
+            var roots = document.querySelectorAll('.tree-root');
+            for (var i = 0; i < roots.length; i++) {
+                roots[i].appendChild(renderNode(roots[i].dataset.tree, 0, 0));
+            }
+        });
     </script>
 </head>
 <body>
@@ -528,104 +685,268 @@ class XDFSchematicGenerator:
         
         <h2>Stream Summary</h2>
         <div class="summary-table table-container">
-"""
+""")
         
         # Add summary table
-        html += summary_df.to_html(index=False, escape=False)
-        html += """
+        # Escape text columns once rather than using to_html's per-cell escaper
+        summary_html_df = summary_df.copy()
+        for col in summary_html_df.columns[summary_html_df.dtypes == object]:
+            summary_html_df[col] = summary_html_df[col].astype(str).str.translate(_HTML_ESCAPE)
+        parts.append(summary_html_df.to_html(index=False, escape=False))
+        parts.append("""
         </div>
-"""
+""")
         
         # Add behavioral data table if available
         if not behavioral_df.empty and self.behavioral_stream_name:
             n_features = len([col for col in behavioral_df.columns if col != 'time_stamp'])
             feature_info = f"Features: {n_features}, " if n_features > 1 else ""
             
-            html += f"""
-        <h2>{self.behavioral_stream_name} Data (Behavioral Events)</h2>
+            parts.append(f"""
+        <h2>{self.behavioral_stream_name.translate(_HTML_ESCAPE)} Data (Behavioral Events)</h2>
         <div class="priority-section">
             <p><strong>This table shows the behavioral markers/events recorded during the experiment.</strong></p>
             <p>{feature_info}Rows: {len(behavioral_df)}, Time span: {behavioral_df['time_stamp'].iloc[0]:.2f} - {behavioral_df['time_stamp'].iloc[-1]:.2f} seconds</p>
-"""
+""")
+            table_df = behavioral_df
+            if len(behavioral_df) > MAX_HTML_ROWS:
+                # Keep the HTML bounded, the full data lives in the CSV
+                n_preview = MAX_HTML_ROWS // 2
+                table_df = pd.concat([behavioral_df.head(n_preview), behavioral_df.tail(n_preview)])
+                full_data_note = "see the CSV file for all rows" if csv_file else "save the CSV file to access all rows"
+                parts.append(f"""
+            <p class="warning">Showing the first and last {n_preview} of {len(behavioral_df)} rows; {full_data_note}.</p>
+""")
             if csv_file:
                 csv_filename = Path(csv_file).name
-                html += f"""
+                parts.append(f"""
             <a href="{csv_filename}" class="csv-link" download>📥 Download as CSV</a>
-"""
-            html += """
+""")
+            parts.append("""
         </div>
         <div class="table-container">
-"""
-            html += behavioral_df.to_html(index=True, escape=False, index_names=['sample_index'])
-            html += """
+""")
+            parts.append(self._build_behavioral_table_html(table_df))
+            parts.append("""
         </div>
-"""
+""")
         elif self.behavioral_idx is None:
-            html += """
+            parts.append("""
         <div class="warning">
             <strong>Warning:</strong> No behavioral stream was found or specified. 
             Use the -b/--behavioral-stream argument to specify the stream name.
         </div>
-"""
+""")
         
         # Add interactive tree
-        html += """
+        stream_trees = self._render_stream_trees(max_depth)
+        parts.append("""
         <h2>Interactive Data Structure Tree</h2>
-"""
+""")
         
         # Build tree for behavioral stream first
         if self.behavioral_idx is not None:
-            stream = self.streams[self.behavioral_idx]
-            info = stream.get('info', {})
-            name = info.get('name', [''])[0] if isinstance(info.get('name'), list) else info.get('name', '')
+            name = self._meta[self.behavioral_idx].name
             
-            html += f"""
+            parts.append(f"""
         <div class="priority-section">
-            <h3>Stream[{self.behavioral_idx}]: {name} (BEHAVIORAL DATA - PRIORITIZED)</h3>
-"""
-            html += self._build_interactive_tree_html(
-                stream, f"stream[{self.behavioral_idx}]", 0, max_depth, "behavioral"
-            )
-            html += """
+            <h3>Stream[{self.behavioral_idx}]: {name.translate(_HTML_ESCAPE)} (BEHAVIORAL DATA - PRIORITIZED)</h3>
+""")
+            parts.append(f'<div class="tree-root" data-tree="{self.behavioral_idx}"></div>')
+            parts.append("""
         </div>
-"""
+""")
         
         # Add other streams
-        html += """
+        parts.append("""
         <h3>Other Streams</h3>
-"""
-        for idx, stream in enumerate(self.streams):
+""")
+        for meta in self._meta:
+            idx, name = meta.index, meta.name
             if idx == self.behavioral_idx:
                 continue
             
-            info = stream.get('info', {})
-            name = info.get('name', [''])[0] if isinstance(info.get('name'), list) else info.get('name', '')
-            
-            html += f"""
+            parts.append(f"""
         <div style="margin-top: 20px;">
-            <h4>Stream[{idx}]: {name}</h4>
-"""
-            html += self._build_interactive_tree_html(
-                stream, f"stream[{idx}]", 0, max_depth, f"stream{idx}"
-            )
-            html += """
+            <h4>Stream[{idx}]: {name.translate(_HTML_ESCAPE)}</h4>
+""")
+            parts.append(f'<div class="tree-root" data-tree="{idx}"></div>')
+            parts.append("""
         </div>
-"""
+""")
         
-        html += """
+        # Embed the flattened trees; every "<" is escaped so neither "</script" nor
+        # "<!--" in stream metadata can change how the script element is parsed
+        tree_json = json.dumps(stream_trees, separators=(',', ':')).replace('<', '\\u003c')
+        parts.append("""
     </div>
+    <template id="tree-node-template">
+        <div class="tree-node"><span class="toggle">▶</span><span class="label"><span class="name"></span>: <span class="type"></span><span class="info-part"> | <span class="info"></span></span><span class="size"></span></span><div class="children" style="display:none;"></div></div>
+    </template>
+    <script id="xdf-tree" type="application/json">""")
+        parts.append(tree_json)
+        parts.append("""</script>
 </body>
 </html>
-"""
+""")
         
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        # Write to file in one buffered pass
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(parts)
         
         print(f"Interactive HTML saved to: {output_file}")
         return output_file
 
 
+def _read_exact(f, n: int) -> bytes:
+    """Read exactly n bytes, raising EOFError if the file ends early."""
+    data = f.read(n)
+    if len(data) < n:
+        raise EOFError()
+    return data
+
+
+def _read_varlen_int(f) -> int:
+    """Read a variable-length integer from an XDF file."""
+    nbytes = _read_exact(f, 1)
+    if nbytes == b'\x01':
+        return _read_exact(f, 1)[0]
+    elif nbytes == b'\x04':
+        return struct.unpack('<I', _read_exact(f, 4))[0]
+    elif nbytes == b'\x08':
+        return struct.unpack('<Q', _read_exact(f, 8))[0]
+    raise RuntimeError("invalid variable-length integer encountered.")
+
+
+def _xml2dict(t: ET.Element) -> Dict[str, Any]:
+    """Convert an XDF header/footer XML element into pyxdf's dict-of-lists layout."""
+    dd = defaultdict(list)
+    for dc in map(_xml2dict, list(t)):
+        for k, v in dc.items():
+            dd[k].append(v)
+    return {t.tag: dd or t.text}
+
+
+def _load_xdf_headers(filename: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Load stream headers and footers from an XDF file without decoding samples.
+    
+    Sample chunks are skipped by seeking past them using their length prefix;
+    only the number of samples in each chunk is read.
+    
+    Parameters
+    ----------
+    filename : str
+        Path to XDF file (.xdfz files are read through gzip)
+    
+    Returns
+    -------
+    streams : list of dict
+        Streams laid out like pyxdf.load_xdf() output, with empty time_series
+        and time_stamps and an extra 'samples_count' entry
+    header : dict
+        File header dictionary
+    """
+    streams = {}
+    header = {}
+    is_gzip = str(filename).endswith('.xdfz')
+    opener = gzip.open if is_gzip else open
+    
+    with opener(filename, 'rb') as f:
+        try:
+            magic = f.read(4)
+        except EOFError:
+            magic = b''
+        if magic != b'XDF:':
+            raise IOError(f"Invalid XDF file: {filename}")
+        # Compressed files cannot report their size, rely on EOFError there
+        file_size = None if is_gzip else os.fstat(f.fileno()).st_size
+        
+        while True:
+            try:
+                chunk_len = _read_varlen_int(f)
+            except EOFError:
+                break
+            
+            # Interrupted recordings often end in a partial chunk; keep what was parsed
+            if file_size is not None and f.tell() + chunk_len > file_size:
+                print(f"Warning: {filename} is truncated, ignoring the incomplete last chunk")
+                break
+            
+            try:
+                tag = struct.unpack('<H', _read_exact(f, 2))[0]
+                remaining = chunk_len - 2
+                
+                if tag == 1:
+                    # FileHeader
+                    header = _xml2dict(ET.fromstring(_read_exact(f, remaining)))
+                    continue
+                if tag not in (2, 3, 6):
+                    # ClockOffset, Boundary and unknown chunks
+                    f.seek(remaining, 1)
+                    continue
+                
+                stream_id = struct.unpack('<I', _read_exact(f, 4))[0]
+                remaining -= 4
+                
+                if tag == 2:
+                    # StreamHeader
+                    info = _xml2dict(ET.fromstring(_read_exact(f, remaining)))['info']
+                    info['stream_id'] = stream_id
+                    streams[stream_id] = {
+                        'info': info,
+                        'time_series': np.array([]),
+                        'time_stamps': np.array([]),
+                        'samples_count': 0,
+                    }
+                elif tag == 3:
+                    # Samples - read the sample count and skip the payload
+                    start = f.tell()
+                    n_samples = _read_varlen_int(f)
+                    f.seek(remaining - (f.tell() - start), 1)
+                    if stream_id in streams:
+                        streams[stream_id]['samples_count'] += n_samples
+                elif stream_id in streams:
+                    # StreamFooter
+                    streams[stream_id]['footer'] = _xml2dict(ET.fromstring(_read_exact(f, remaining)))
+                else:
+                    f.seek(remaining, 1)
+            except (EOFError, struct.error):
+                print(f"Warning: {filename} is truncated, ignoring the incomplete last chunk")
+                break
+            except ET.ParseError:
+                # The chunk was read completely, so the next one can still be parsed
+                print(f"Warning: skipping chunk with malformed XML in {filename}")
+    
+    return list(streams.values()), header
+
+
+def _memory_map_streams(streams: List[Dict[str, Any]], directory: str) -> None:
+    """
+    Replace numeric time_series arrays with read-only memory maps.
+    
+    Each array is saved as .npy in directory and loaded back with
+    mmap_mode='r', so only the pages that are actually accessed stay resident.
+    
+    Parameters
+    ----------
+    streams : list of dict
+        Streams returned by pyxdf.load_xdf(), modified in place
+    directory : str
+        Directory for the backing .npy files (must outlive the streams)
+    """
+    for idx, stream in enumerate(streams):
+        time_series = stream.get('time_series')
+        if not isinstance(time_series, np.ndarray) or time_series.size == 0:
+            continue
+        if time_series.dtype.kind not in 'biufc':
+            continue
+        
+        npy_file = Path(directory) / f"stream_{idx}_time_series.npy"
+        np.save(npy_file, time_series)
+        stream['time_series'] = np.load(npy_file, mmap_mode='r')
+
+
 def main():
     """Command-line interface."""
     parser = argparse.ArgumentParser(
@@ -644,6 +965,12 @@ Examples:
   
   # Skip CSV export
   python xdf_render_lib.py data.xdf --no-csv
+  
+  # Quick structure overview of a large file (no sample decoding)
+  python xdf_render_lib.py data.xdf --headers-only
+  
+  # Keep numeric streams on disk instead of in RAM
+  python xdf_render_lib.py data.xdf --mmap
         """
     )
     parser.add_argument(
@@ -672,19 +999,52 @@ Examples:
         action='store_true',
         help='Skip saving behavioral data as CSV'
     )
+    parser.add_argument(
+        '--headers-only',
+        action='store_true',
+        help='Only read stream headers/footers and skip decoding samples (much faster for large files, no behavioral data). '
+             'Durations come from stream footers and are reported as NaN for streams without one; '
+             'time_series_shape is reported as N/A.'
+    )
+    parser.add_argument(
+        '--mmap',
+        action='store_true',
+        help='Back numeric time series with temporary memory-mapped files to reduce resident memory. '
+             'Needs free disk space for a full copy of all numeric streams.'
+    )
+    parser.add_argument(
+        '--mmap-dir',
+        default=None,
+        help='Directory for the --mmap backing files (default: next to the output file). '
+             'Avoid tmpfs locations such as /tmp, which are held in RAM.'
+    )
     
     args = parser.parse_args()
     
-    # Import pyxdf here so it's only required when running as script
-    try:
-        import pyxdf
-    except ImportError:
-        print("Error: pyxdf is required. Install with: pip install pyxdf")
-        sys.exit(1)
+    if args.headers_only:
+        # Load XDF headers only
+        print(f"Loading XDF headers: {args.xdf_file}")
+        streams, header = _load_xdf_headers(args.xdf_file)
+    else:
+        # Import pyxdf here so it's only required when running as script
+        try:
+            import pyxdf
+        except ImportError:
+            print("Error: pyxdf is required. Install with: pip install pyxdf")
+            sys.exit(1)
+        
+        # Load XDF file
+        print(f"Loading XDF file: {args.xdf_file}")
+        streams, header = pyxdf.load_xdf(args.xdf_file)
     
-    # Load XDF file
-    print(f"Loading XDF file: {args.xdf_file}")
-    streams, header = pyxdf.load_xdf(args.xdf_file)
+    mmap_dir = None
+    if args.mmap:
+        # Keep the backing files on real disk next to the output, not in $TMPDIR
+        # (often tmpfs, which would keep the "mapped" arrays in RAM anyway)
+        parent_dir = args.mmap_dir or Path(args.output).resolve().parent
+        mmap_dir = tempfile.TemporaryDirectory(prefix='xdf_mmap_', dir=parent_dir)
+        print(f"Memory-mapping numeric streams in: {mmap_dir.name}")
+        _memory_map_streams(streams, mmap_dir.name)
     
     # Generate schematic
     generator = XDFSchematicGenerator(streams, header, 
@@ -698,6 +1058,11 @@ Examples:
         save_behavioral_csv=not args.no_csv
     )
     
+    if mmap_dir is not None:
+        # Release the memory maps before removing their backing files
+        del generator, streams
+        mmap_dir.cleanup()
+    
     print(f"\nDone! Open {output_file} in a web browser to explore the data structure.")
 
 